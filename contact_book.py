@@ -1,11 +1,40 @@
-from collections import UserDict
-from datetime import datetime, timedelta
-from typing import List, Optional
+import functools
+import sys
+from datetime import date
+from typing import Iterable, Iterator, List, Optional
+
+
+def _validate_phone(value: str) -> str:
+    """Перевіряє формат номера (10 ASCII-цифр) і повертає інтернований рядок."""
+    # isascii/isdigit — однопрохідні C-перевірки; на відміну від regex \d
+    # вони також відкидають юнікодні цифри
+    if len(value) != 10 or not (value.isascii() and value.isdigit()):
+        raise ValueError("Номер телефону повинен складатися з 10 цифр.")
+    # Інтернування дозволяє однаковим номерам ділити один об'єкт рядка
+    return sys.intern(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_bday(value: str) -> date:
+    """Розбирає дату у форматі DD.MM.YYYY.
+
+    Спеціалізований розбір замість strptime: формат фіксований, тому зрізи
+    рядка та пряме створення date значно швидші. Кеш дозволяє повторним
+    завантаженням однакових дат обходитися одним пошуком у словнику.
+    """
+    if len(value) != 10 or value[2] != "." or value[5] != ".":
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    try:
+        return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+    except ValueError:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
 
 class Field:
     """Базовий клас для полів запису."""
-    
+
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         self.value = value
 
@@ -15,139 +44,238 @@ class Field:
 
 class Name(Field):
     """Клас для зберігання імені контакту. Обов'язкове поле."""
-    
+
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         if not value or not value.strip():
             raise ValueError("Ім'я контакту не може бути порожнім.")
-        super().__init__(value.strip())
+        # Імена служать ключами адресної книги: інтерновані рядки порівнюються
+        # за вказівником і діляться пам'яттю між повторними імпортами
+        super().__init__(sys.intern(value.strip()))
 
 
 class Phone(Field):
-    """Клас для зберігання номера телефону. Має валідацію формату (10 цифр)."""
-    
+    """Клас для зберігання номера телефону. Має валідацію формату (10 цифр).
+
+    Record зберігає номери як прості рядки; клас залишено як тонку обгортку
+    для зворотної сумісності.
+    """
+
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
-        if not value.isdigit() or len(value) != 10:
-            raise ValueError("Номер телефону повинен складатися з 10 цифр.")
-        super().__init__(value)
+        super().__init__(_validate_phone(value))
 
 
 class Birthday(Field):
-    """Клас для зберігання дати народження. Формат: DD.MM.YYYY."""
-    
+    """Клас для зберігання дати народження. Формат: DD.MM.YYYY.
+
+    Дата зберігається як легкий datetime.date, а не datetime.
+    """
+
+    __slots__ = ("date",)
+
     def __init__(self, value: str) -> None:
-        try:
-            # Перевірка коректності даних та перетворення рядка на об'єкт datetime
-            self.date = datetime.strptime(value, "%d.%m.%Y")
-            super().__init__(value)
-        except ValueError:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        self.date: date = _parse_bday(value)
+        super().__init__(value)
 
 
 class Record:
     """Клас для зберігання інформації про контакт, включаючи ім'я та список телефонів."""
-    
+
+    __slots__ = ("name", "phones", "birthday", "_book", "_phone_index", "_str_cache")
+
     def __init__(self, name: str) -> None:
         self.name = Name(name)
-        self.phones: List[Phone] = []
+        # Номери зберігаються як прості рядки: без обгортки Phone на кожен
+        # номер економимо об'єкт та розіменування атрибута в гарячих циклах
+        self.phones: List[str] = []
         self.birthday: Optional[Birthday] = None
+        # Індекс номер -> позиція у self.phones для пошуку без перебору списку
+        self._phone_index: dict[str, int] = {}
+        # Книга, до якої належить запис (для підтримки індексу днів народження)
+        self._book: Optional["AddressBook"] = None
+        # Кеш рядкового представлення; скидається при зміні запису
+        self._str_cache: Optional[str] = None
 
     def add_phone(self, phone_number: str) -> None:
         """Додавання телефону."""
-        phone = Phone(phone_number)
+        phone = _validate_phone(phone_number)
+        # Дублікат зламав би індекс: він зберігає одну позицію на номер
+        if phone in self._phone_index:
+            raise ValueError("Такий номер телефону вже додано.")
         self.phones.append(phone)
+        self._phone_index[phone] = len(self.phones) - 1
+        self._str_cache = None
 
     def remove_phone(self, phone_number: str) -> None:
         """Видалення телефону."""
-        phone_to_remove = self.find_phone(phone_number)
-        if phone_to_remove:
-            self.phones.remove(phone_to_remove)
-        else:
+        position = self._phone_index.pop(phone_number, None)
+        if position is None:
             raise ValueError("Номер телефону не знайдено.")
+        # Переставляємо останній номер на місце видаленого, щоб pop був O(1)
+        last_phone = self.phones.pop()
+        if position < len(self.phones):
+            self.phones[position] = last_phone
+            self._phone_index[last_phone] = position
+        self._str_cache = None
 
     def edit_phone(self, old_phone_number: str, new_phone_number: str) -> None:
         """Редагування телефону."""
-        for i, p in enumerate(self.phones):
-            if p.value == old_phone_number:
-                self.phones[i] = Phone(new_phone_number)
-                return
-        raise ValueError("Номер телефону для редагування не знайдено.")
-
-    def find_phone(self, phone_number: str) -> Optional[Phone]:
+        position = self._phone_index.get(old_phone_number)
+        if position is None:
+            raise ValueError("Номер телефону для редагування не знайдено.")
+        phone = _validate_phone(new_phone_number)
+        if phone == old_phone_number:
+            return
+        if phone in self._phone_index:
+            raise ValueError("Такий номер телефону вже додано.")
+        del self._phone_index[old_phone_number]
+        self.phones[position] = phone
+        self._phone_index[phone] = position
+        self._str_cache = None
+
+    def find_phone(self, phone_number: str) -> Optional[str]:
         """Пошук телефону."""
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return phone_number if phone_number in self._phone_index else None
 
     def add_birthday(self, birthday: str) -> None:
         """Додавання дня народження до контакту."""
+        old_birthday = self.birthday
         self.birthday = Birthday(birthday)
+        self._str_cache = None
+        if self._book is not None:
+            self._book._reindex_birthday(self, old_birthday)
 
     def __str__(self) -> str:
-        phones_str = '; '.join(p.value for p in self.phones)
-        birthday_str = f", birthday: {self.birthday.value}" if self.birthday else ""
-        return f"Contact name: {self.name.value}, phones: {phones_str}{birthday_str}"
+        if self._str_cache is None:
+            phones_str = '; '.join(self.phones)
+            birthday_str = f", birthday: {self.birthday.value}" if self.birthday else ""
+            self._str_cache = f"Contact name: {self.name.value}, phones: {phones_str}{birthday_str}"
+        return self._str_cache
 
 
-class AddressBook(UserDict):
-    """Клас для зберігання та управління записами."""
-    
+class AddressBook(dict):
+    """Клас для зберігання та управління записами.
+
+    Успадковується безпосередньо від dict: на відміну від UserDict доступ
+    до записів не проходить через проміжний атрибут self.data.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Індекс (місяць, день) -> записи з днем народження цієї дати.
+        # Дозволяє шукати найближчі дні народження без повного перебору книги.
+        self._by_mmdd: dict[tuple[int, int], List[Record]] = {}
+
     def add_record(self, record: Record) -> None:
         """Додавання запису."""
-        self.data[record.name.value] = record
+        existing = self.get(record.name.value)
+        if existing is not None:
+            if existing.birthday is not None:
+                self._unindex_birthday(existing, existing.birthday)
+            existing._book = None
+        self[record.name.value] = record
+        record._book = self
+        if record.birthday is not None:
+            self._index_birthday(record)
+
+    def add_records(self, records: Iterable[Record]) -> None:
+        """Масове додавання записів.
+
+        Один щільний цикл із локальними посиланнями на словники амортизує
+        накладні витрати на виклик add_record для кожного запису окремо.
+        """
+        data = self
+        setdefault = self._by_mmdd.setdefault
+        for record in records:
+            name = record.name.value
+            existing = data.get(name)
+            if existing is not None:
+                if existing.birthday is not None:
+                    self._unindex_birthday(existing, existing.birthday)
+                existing._book = None
+            data[name] = record
+            record._book = self
+            birthday = record.birthday
+            if birthday is not None:
+                setdefault((birthday.date.month, birthday.date.day), []).append(record)
 
     def find(self, name: str) -> Optional[Record]:
         """Пошук запису за ім'ям."""
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> None:
         """Видалення запису за ім'ям."""
-        if name in self.data:
-            del self.data[name]
-        else:
+        record = self.get(name)
+        if record is None:
             raise KeyError("Контакт не знайдено.")
-
-    def get_upcoming_birthdays(self) -> List[dict]:
+        if record.birthday is not None:
+            self._unindex_birthday(record, record.birthday)
+        record._book = None
+        del self[name]
+
+    def _index_birthday(self, record: Record) -> None:
+        """Додає запис до індексу днів народження."""
+        key = (record.birthday.date.month, record.birthday.date.day)
+        self._by_mmdd.setdefault(key, []).append(record)
+
+    def _unindex_birthday(self, record: Record, birthday: Birthday) -> None:
+        """Видаляє запис з індексу днів народження."""
+        key = (birthday.date.month, birthday.date.day)
+        records = self._by_mmdd.get(key)
+        if records is not None and record in records:
+            records.remove(record)
+            if not records:
+                del self._by_mmdd[key]
+
+    def _reindex_birthday(self, record: Record, old_birthday: Optional[Birthday]) -> None:
+        """Оновлює індекс після зміни дня народження запису."""
+        if old_birthday is not None:
+            self._unindex_birthday(record, old_birthday)
+        self._index_birthday(record)
+
+    def get_upcoming_birthdays(self) -> Iterator[tuple[str, str]]:
         """
-        Повертає список користувачів, яких потрібно привітати на наступному тижні.
-        
-        Returns:
-            List[dict]: Список словників з іменами та датами привітання
+        Генерує користувачів, яких потрібно привітати на наступному тижні.
+
+        Yields:
+            tuple[str, str]: Пара (ім'я, дата привітання)
         """
-        upcoming_birthdays = []
-        today = datetime.today().date()
-        
-        for record in self.data.values():
-            if record.birthday:
-                # Отримуємо дату народження
-                birthday_date = record.birthday.date.date()
-                
-                # Переносимо день народження на поточний рік
-                birthday_this_year = birthday_date.replace(year=today.year)
-                
-                # Якщо день народження вже минув цього року, беремо наступний рік
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_date.replace(year=today.year + 1)
-                
-                # Перевіряємо, чи день народження в найближчі 7 днів
-                days_until_birthday = (birthday_this_year - today).days
-                
-                if 0 <= days_until_birthday <= 7:
-                    # Перевіряємо, чи випадає на вихідні
-                    congratulation_date = birthday_this_year
-                    
-                    # Якщо субота (5) або неділя (6), переносимо на понеділок
-                    if birthday_this_year.weekday() == 5:  # Субота
-                        congratulation_date = birthday_this_year + timedelta(days=2)
-                    elif birthday_this_year.weekday() == 6:  # Неділя
-                        congratulation_date = birthday_this_year + timedelta(days=1)
-                    
-                    upcoming_birthdays.append({
-                        "name": record.name.value,
-                        "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
-                    })
-        
-        return upcoming_birthdays
+        # Арифметика дат у просторі ординалів: додавання днів та визначення
+        # дня тижня — цілочисельні операції без проміжних timedelta
+        today_ord = date.today().toordinal()
+
+        # Один раз на виклик готуємо 8 найближчих дат: перенесення з вихідних
+        # та форматування рядка привітання обчислюються тут, а не для кожного запису
+        offsets = []
+        for i in range(8):
+            day_ord = today_ord + i
+            congratulation_ord = day_ord
+
+            # Ординал 1 — понеділок, тому день тижня = (ординал - 1) % 7.
+            # Якщо субота (5) або неділя (6), переносимо на понеділок
+            weekday = (day_ord - 1) % 7
+            if weekday == 5:  # Субота
+                congratulation_ord = day_ord + 2
+            elif weekday == 6:  # Неділя
+                congratulation_ord = day_ord + 1
+
+            birthday_this_year = date.fromordinal(day_ord)
+            congratulation_date = date.fromordinal(congratulation_ord)
+
+            congratulation_str = (
+                f"{congratulation_date.day:02d}."
+                f"{congratulation_date.month:02d}."
+                f"{congratulation_date.year}"
+            )
+            offsets.append(((birthday_this_year.month, birthday_this_year.day), congratulation_str))
+
+        # Завдяки індексу перебираємо лише записи з цими 8 датами
+        for key, congratulation_str in offsets:
+            for record in self._by_mmdd.get(key, ()):
+                yield record.name.value, congratulation_str
 
 
 def main() -> None:
@@ -170,7 +298,7 @@ def main() -> None:
 
     # Виведення всіх записів у книзі
     print("All records in the address book:")
-    for name, record in book.data.items():
+    for name, record in book.items():
         print(record)
 
     # Знаходження та редагування телефону для John
@@ -191,7 +319,7 @@ def main() -> None:
     book.delete("Jane")
     
     print("\nAll records after deletion:")
-    for name, record in book.data.items():
+    for name, record in book.items():
         print(record)
 
 
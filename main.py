@@ -7,30 +7,6 @@ from typing import Callable, List
 from contact_book import AddressBook, Record
 
 
-def input_error(func: Callable) -> Callable:
-    """
-    Декоратор для обробки помилок вводу користувача.
-    
-    Args:
-        func: Функція-обробник команди
-        
-    Returns:
-        Callable: Обгорнута функція з обробкою помилок
-    """
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except ValueError as e:
-            return f"Помилка значення: {e}"
-        except IndexError:
-            return "Недостатньо аргументів для команди."
-        except KeyError as e:
-            return f"Помилка ключа: {e}"
-        except Exception as e:
-            return f"Несподівана помилка: {e}"
-    return inner
-
-
 def parse_input(user_input: str) -> tuple[str, List[str]]:
     """
     Розбирає введений користувачем рядок на команду та аргументи.
@@ -41,13 +17,14 @@ def parse_input(user_input: str) -> tuple[str, List[str]]:
     Returns:
         tuple: Команда та список аргументів
     """
-    parts = user_input.strip().split()
-    command = parts[0].lower() if parts else ""
-    args = parts[1:]
-    return command, args
+    stripped = user_input.strip()
+    if not stripped:
+        return "", []
+    # Відокремлюємо команду одним проходом; решту токенізуємо лише за потреби
+    command, _, rest = stripped.partition(" ")
+    return command.lower(), rest.split() if rest else []
 
 
-@input_error
 def add_contact(args: List[str], book: AddressBook) -> str:
     """
     Додає новий контакт або телефон до існуючого контакту.
@@ -77,7 +54,6 @@ def add_contact(args: List[str], book: AddressBook) -> str:
     return message
 
 
-@input_error
 def change_contact(args: List[str], book: AddressBook) -> str:
     """
     Змінює телефон для існуючого контакту.
@@ -102,7 +78,6 @@ def change_contact(args: List[str], book: AddressBook) -> str:
     return "Contact updated."
 
 
-@input_error
 def show_phone(args: List[str], book: AddressBook) -> str:
     """
     Показує телефони для вказаного контакту.
@@ -126,11 +101,10 @@ def show_phone(args: List[str], book: AddressBook) -> str:
     if not record.phones:
         return f"У контакту {name} немає телефонів."
     
-    phones = "; ".join(phone.value for phone in record.phones)
+    phones = "; ".join(record.phones)
     return f"{name}: {phones}"
 
 
-@input_error
 def show_all(book: AddressBook) -> str:
     """
     Показує всі контакти в адресній книзі.
@@ -141,17 +115,12 @@ def show_all(book: AddressBook) -> str:
     Returns:
         str: Список всіх контактів або повідомлення про порожню книгу
     """
-    if not book.data:
+    if not book:
         return "Адресна книга порожня."
-    
-    result = []
-    for record in book.data.values():
-        result.append(str(record))
-    
-    return "\n".join(result)
+
+    return "\n".join(str(record) for record in book.values())
 
 
-@input_error
 def add_birthday(args: List[str], book: AddressBook) -> str:
     """
     Додає дату народження до контакту.
@@ -176,7 +145,6 @@ def add_birthday(args: List[str], book: AddressBook) -> str:
     return "Birthday added."
 
 
-@input_error
 def show_birthday(args: List[str], book: AddressBook) -> str:
     """
     Показує дату народження для вказаного контакту.
@@ -203,7 +171,6 @@ def show_birthday(args: List[str], book: AddressBook) -> str:
     return f"{name}: {record.birthday.value}"
 
 
-@input_error
 def birthdays(args: List[str], book: AddressBook) -> str:
     """
     Показує дні народження, які відбудуться протягом наступного тижня.
@@ -215,26 +182,15 @@ def birthdays(args: List[str], book: AddressBook) -> str:
     Returns:
         str: Список днів народження або повідомлення про їх відсутність
     """
-    upcoming = book.get_upcoming_birthdays()
-    
-    if not upcoming:
-        return "Немає днів народження на наступному тижні."
-    
-    result = []
-    for item in upcoming:
-        result.append(f"{item['name']}: {item['congratulation_date']}")
-    
-    return "\n".join(result)
+    result = "\n".join(
+        f"{name}: {congratulation_date}"
+        for name, congratulation_date in book.get_upcoming_birthdays()
+    )
+    return result if result else "Немає днів народження на наступному тижні."
 
 
-def show_help() -> str:
-    """
-    Показує список всіх доступних команд з описом та аргументами.
-    
-    Returns:
-        str: Форматований список команд
-    """
-    help_text = """
+# Текст довідки — константа, тому будуємо її один раз при імпорті модуля
+_HELP_TEXT = """
 Доступні команди:
 
   hello
@@ -278,8 +234,60 @@ def show_help() -> str:
   close або exit
     Закрити програму.
     Приклад: exit
-"""
-    return help_text.strip()
+""".strip()
+
+
+def show_help() -> str:
+    """
+    Показує список всіх доступних команд з описом та аргументами.
+
+    Returns:
+        str: Форматований список команд
+    """
+    return _HELP_TEXT
+
+
+# Таблиця диспетчеризації команд: пошук обробника — одна dict-операція
+# замість ланцюжка порівнянь рядків
+COMMANDS: dict[str, Callable[[List[str], AddressBook], str]] = {
+    "hello": lambda args, book: "How can I help you?",
+    "help": lambda args, book: show_help(),
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": lambda args, book: show_all(book),
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
+
+def handle_command(command: str, args: List[str], book: AddressBook) -> str:
+    """
+    Виконує команду з централізованою обробкою помилок вводу.
+
+    Args:
+        command: Назва команди
+        args: Список аргументів команди
+        book: Адресна книга
+
+    Returns:
+        str: Результат виконання або повідомлення про помилку
+    """
+    handler = COMMANDS.get(command)
+    if handler is None:
+        return "Invalid command."
+
+    try:
+        return handler(args, book)
+    except ValueError as e:
+        return f"Помилка значення: {e}"
+    except IndexError:
+        return "Недостатньо аргументів для команди."
+    except KeyError as e:
+        return f"Помилка ключа: {e}"
+    except Exception as e:
+        return f"Несподівана помилка: {e}"
 
 
 def main() -> None:
@@ -289,44 +297,16 @@ def main() -> None:
     book = AddressBook()
     print("Welcome to the assistant bot!")
     print("Type 'help' to see available commands.")
-    
+
     while True:
         user_input = input("Enter a command: ")
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command in ("close", "exit"):
             print("Good bye!")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-
-        elif command == "help":
-            print(show_help())
-
-        elif command == "add":
-            print(add_contact(args, book))
-
-        elif command == "change":
-            print(change_contact(args, book))
-
-        elif command == "phone":
-            print(show_phone(args, book))
-
-        elif command == "all":
-            print(show_all(book))
-
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(birthdays(args, book))
-
-        else:
-            print("Invalid command.")
+        print(handle_command(command, args, book))
 
 
 if __name__ == "__main__":
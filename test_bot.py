@@ -4,14 +4,15 @@
 
 from contact_book import AddressBook
 from main import (
-    add_contact, 
-    change_contact, 
-    show_phone, 
-    show_all, 
-    add_birthday, 
-    show_birthday, 
+    add_contact,
+    change_contact,
+    show_phone,
+    show_all,
+    add_birthday,
+    show_birthday,
     birthdays,
-    show_help
+    show_help,
+    handle_command
 )
 
 
@@ -64,25 +65,25 @@ def test_bot():
     print("\n8. Найближчі дні народження:")
     print(birthdays([], book))
     
-    # Тест 9: Обробка помилок
+    # Тест 9: Обробка помилок (через handle_command, де вони перехоплюються)
     print("\n9. Тестування обробки помилок:")
     print("9.1. Неправильний формат телефону:")
-    print(add_contact(["Test", "123"], book))
-    
+    print(handle_command("add", ["Test", "123"], book))
+
     print("\n9.2. Неправильний формат дати:")
-    print(add_birthday(["John", "32.13.2000"], book))
-    
+    print(handle_command("add-birthday", ["John", "32.13.2000"], book))
+
     print("\n9.3. Контакт не знайдено:")
     print(show_phone(["Unknown"], book))
-    
+
     print("\n9.4. Недостатньо аргументів:")
-    print(add_contact(["OnlyName"], book))
-    
+    print(handle_command("add", ["OnlyName"], book))
+
     print("\n9.5. Порожнє ім'я:")
-    print(add_contact(["", "1234567890"], book))
-    
+    print(handle_command("add", ["", "1234567890"], book))
+
     print("\n9.6. Ім'я з пробілів:")
-    print(add_contact(["   ", "1234567890"], book))
+    print(handle_command("add", ["   ", "1234567890"], book))
     
     print("\n" + "=" * 50)
     print("Тестування завершено!")